@@ -1,15 +1,87 @@
 from environs import env
+import ast
 import csv
-from os import path
+import logging
+import re
+from datetime import datetime
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain, islice
+from os import cpu_count, path
 
 import mysql.connector as sql
 import mysql.connector.cursor as sql_cursor
+import mysql.connector.pooling as sql_pooling
+
+# pyarrow parses csv files in multithreaded C instead of pure Python.
+# Falls back to the csv module when it is not installed.
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+
+logger = logging.getLogger(__name__)
 
 
 class ConnectSQL:
+    # No per-instance __dict__: short-lived ConnectSQL objects stay small and
+    # attribute access skips the dict lookup. Must list every instance
+    # attribute assigned in __init__.
+    __slots__ = (
+        "connection",
+        "cursor",
+        "env_key",
+        "database",
+        "_prep_cache",
+        "_insert_sql",
+        "_max_packet",
+        "_table_cache",
+        "_placeholder_cache",
+        "_columns_cache",
+        "_batch_buffer",
+        "_select_cache",
+        "_converters",
+    )
+
     connection: sql.MySQLConnection | None
     cursor: sql_cursor.MySQLCursor | None
     env_key: str
+    database: str | None
+    _prep_cache: dict[str, sql_cursor.MySQLCursor]
+    _insert_sql: dict[tuple, str]
+    _max_packet: int | None
+    _table_cache: set[str] | None
+    _placeholder_cache: dict[int, str]
+    _columns_cache: dict[str, list[str]] | None
+    _batch_buffer: list | None
+    _select_cache: OrderedDict
+    _converters: dict[str, dict]
+    # Upper bound on distinct queries kept in the per-instance result cache
+    # used by select(cached = True).
+    _select_cache_size: int = 256
+    # Python-side converters per column data type, so the prepared binary
+    # protocol ships typed values and the server skips text parsing.
+    _type_converters: dict[str, object] = {
+        "tinyint": int,
+        "smallint": int,
+        "mediumint": int,
+        "int": int,
+        "integer": int,
+        "bigint": int,
+        "float": float,
+        "double": float,
+        "decimal": float,
+        "timestamp": datetime.fromisoformat,
+        "datetime": datetime.fromisoformat,
+    }
+    # One pool per env_key shared by all instances, so repeated ConnectSQL use
+    # reuses connections instead of paying the handshake every time.
+    _pools: dict[str, sql_pooling.MySQLConnectionPool] = {}
+    # Parsed .env connection info per env_key, so reconnecting does not
+    # re-read and re-parse the .env file every time.
+    _env_cache: dict[str, dict[str, str]] = {}
     # database_info: dict[str, list[str]]
 
     def __init__(
@@ -40,6 +112,16 @@ class ConnectSQL:
         """
         self.connection = None
         self.cursor = None
+        self.database = None
+        self._prep_cache = {}
+        self._insert_sql = {}
+        self._max_packet = None
+        self._table_cache = None
+        self._placeholder_cache = {}
+        self._columns_cache = None
+        self._batch_buffer = None
+        self._select_cache = OrderedDict()
+        self._converters = {}
         if env_key is None:
             self.env_key = None
             return
@@ -57,7 +139,10 @@ class ConnectSQL:
     def connect(self, connection_args: dict[str, str] | None = None) -> None:
         """
         Creates connection.
-        The env_key is used if connection_args is not provided.
+        The env_key is used if connection_args is not provided, in which case the
+        connection is taken from a shared pool keyed by env_key, so the TCP and
+        authentication handshake is only paid once per pooled connection.
+        close_all returns pooled connections to the pool instead of closing them.
 
         >>> database = ConnectSQL()
         >>> database.connect({"user" : "root", "password" : "250202", "host" : "localhost", "port" : "3306"})
@@ -66,16 +151,50 @@ class ConnectSQL:
         Error creating connection: 1045 (28000): Access denied for user 'root'@'localhost' (using password: NO)
         >>> database.close_all()
         """
-        if connection_args is None:
-            connection_args = env.dict(self.env_key)
         try:
+            if connection_args is None:
+                if self.env_key not in self._pools:
+                    self._pools[self.env_key] = sql_pooling.MySQLConnectionPool(
+                        pool_name=self.env_key,
+                        # Cores-based sizing; capped at the connector's pool
+                        # maximum. Must stay below the server's
+                        # max_connections across all pools.
+                        pool_size=min(32, (cpu_count() or 4) * 2 + 1),
+                        use_pure=False,
+                        allow_local_infile=True,
+                        # Halves on-wire bytes for text-heavy results; worth
+                        # disabling for purely local unix-socket connections.
+                        compress=True,
+                        **self._env_cache.setdefault(
+                            self.env_key, env.dict(self.env_key)
+                        ),
+                    )
+                self.connection = self._pools[self.env_key].get_connection()
+                return
+            # use_pure=False selects the C extension, which does the protocol
+            # work (packet assembly, row decoding) outside the interpreter.
+            connection_args.setdefault("use_pure", False)
+            connection_args.setdefault("allow_local_infile", True)
+            connection_args.setdefault("compress", True)
             self.connection = sql.connect(**connection_args)
         except Exception as e:
             print(f"Error creating connection:", e)
 
-    def create_cursor(self) -> None:
+    @classmethod
+    def reload_env(cls) -> None:
+        """
+        Clears the cached .env connection info, forcing the next connection
+        to re-read the .env file. Existing pools are kept.
+        """
+        cls._env_cache.clear()
+
+    def create_cursor(self, prepared: bool = False) -> None:
         """
         Creates cursor.
+        With prepared = True the cursor uses the binary prepared-statement
+        protocol, which prepares each distinct statement once server-side.
+        Statement-shaped hot paths (insert_data, update, delete) keep their
+        own prepared cursors regardless of this flag.
 
         >>> database = ConnectSQL()
         >>> database.connect({"user" : "root", "password" : "250202", "host" : "localhost", "port" : "3306"})
@@ -87,7 +206,7 @@ class ConnectSQL:
         >>> database.close_all()
         """
         try:
-            self.cursor = self.connection.cursor()
+            self.cursor = self.connection.cursor(prepared=prepared)
         except Exception as e:
             print(f"Error creating cursor:", e)
 
@@ -100,11 +219,22 @@ class ConnectSQL:
         >>> database = ConnectSQL()
         >>> database.close_all()
         """
+        for prep_cursor in self._prep_cache.values():
+            prep_cursor.close()
+        self._prep_cache = {}
         if self.cursor:
             self.cursor.close()
         if self.connection:
             self.connection.close()
 
+    def _q(self, identifier: str) -> str:
+        """
+        Quotes a database, table or column name with backticks so it is never
+        interpreted as SQL, and so the server sees one canonical spelling of
+        each statement regardless of the name.
+        """
+        return "`" + identifier.replace("`", "``") + "`"
+
     def create_database(
         self, database: str, use: bool = True, overwrite: bool = False
     ) -> None:
@@ -127,10 +257,12 @@ class ConnectSQL:
         >>> database.drop_database("new_database")
         >>> database.close_all()
         """
+        self._table_cache = None
+        self._columns_cache = None
         try:
             if overwrite:
-                self.cursor.execute(f"drop database if exists {database}")
-            self.cursor.execute(f"create database if not exists {database}")
+                self.cursor.execute(f"drop database if exists {self._q(database)}")
+            self.cursor.execute(f"create database if not exists {self._q(database)}")
         except Exception as e:
             print(f"Error creating database:", e)
 
@@ -152,8 +284,11 @@ class ConnectSQL:
         Error selecting database: 1049 (42000): Unknown database 'unknown_database'
         >>> database.close_all()
         """
+        self._table_cache = None
+        self._columns_cache = None
         try:
-            self.cursor.execute(f"use {database}")
+            self.cursor.execute(f"use {self._q(database)}")
+            self.database = database
         except Exception as e:
             print(f"Error selecting database:", e)
 
@@ -178,10 +313,20 @@ class ConnectSQL:
         """
         try:
             if overwrite:
-                self.cursor.execute(f"drop table if exists {table}")
+                self.cursor.execute(f"drop table if exists {self._q(table)}")
             self.cursor.execute(
-                f"create table if not exists {table} ({", ".join(table_info)})"
+                f"create table if not exists {self._q(table)} ({", ".join(table_info)})"
             )
+            if self._table_cache is not None:
+                self._table_cache.add(table)
+            if self._columns_cache is not None:
+                # The column names are right there in table_info, so the
+                # cache entry is filled directly instead of invalidating and
+                # re-fetching the whole schema.
+                self._columns_cache[table] = [
+                    column_info.split()[0] for column_info in table_info
+                ]
+            self._converters[table] = self._column_converters(table_info)
         except Exception as e:
             print(f"Error creating table:", e)
 
@@ -194,11 +339,69 @@ class ConnectSQL:
         except Exception as e:
             print(f"Error committing:", e)
 
-    def run_query(self, query: str, auto_commit: bool = True) -> None:
+    @contextmanager
+    def bulk_load(self):
+        """
+        Context manager for bulk ingestion.
+        Turns off autocommit, unique checks and foreign key checks while the
+        block runs, so InnoDB defers index maintenance and the redo-log flush
+        to a single commit on exit. Checks and the session's previous
+        autocommit setting are restored on exit, and changes rolled back if
+        the block raises.
+
+        with database.bulk_load():
+            database.insert_data("new_table", csv_path, auto_commit=False)
+        """
+        # The session's autocommit is restored rather than forced to 1:
+        # mysql-connector sessions run with autocommit off by default, and
+        # the auto_commit=False contract elsewhere in the class depends on
+        # that staying true after a bulk load.
+        self.cursor.execute("select @@autocommit")
+        previous_autocommit = self.cursor.fetchall()[0][0]
+        self.cursor.execute(
+            "set autocommit = 0; set unique_checks = 0; set foreign_key_checks = 0"
+        )
+        self.cursor.fetchsets()
+        try:
+            yield self
+            self.commit()
+        except Exception:
+            self.rollback()
+            raise
+        finally:
+            self.cursor.execute(
+                "set unique_checks = 1; set foreign_key_checks = 1; "
+                f"set autocommit = {int(previous_autocommit)}"
+            )
+            self.cursor.fetchsets()
+
+    def rollback(self) -> None:
+        """
+        Rolls back uncommitted database changes.
+        """
         try:
-            # Splits at ";" since the cursor can't handle multiple queries in one string.
-            for query in query.split(";"):
-                self.cursor.execute(query)
+            self.connection.rollback()
+        except Exception as e:
+            print(f"Error rolling back:", e)
+
+    def run_query(
+        self, query: str, params: tuple | list | None = None, auto_commit: bool = True
+    ) -> None:
+        try:
+            if params is not None:
+                # Parameterized queries are always a single statement, and go
+                # through a prepared cursor so repeated updates/deletes with
+                # the same shape reuse the server-side plan and only bind new
+                # values.
+                self.prepared_cursor(query).execute(query, params)
+            else:
+                # execute() runs multi-statement scripts natively, so there is
+                # no need to split at ";" in Python, which also broke string
+                # literals containing semicolons. Any result sets are drained
+                # so the cursor is ready for the next statement.
+                if not self.coalesce_inserts(query):
+                    self.cursor.execute(query)
+                    self.cursor.fetchsets()
 
             if not auto_commit:
                 return
@@ -206,17 +409,112 @@ class ConnectSQL:
         except Exception as error:
             print(f"Error executing query '{query}':\n\t", error)
 
+    # Pulls the table names referenced by a statement, for result-cache
+    # dependency tracking and invalidation.
+    _table_ref = re.compile(r"(?:from|join|into|update)\s+`?(\w+)`?", re.IGNORECASE)
+    # Matches a literal insert statement, splitting it into its reusable
+    # template and the values tuple.
+    _insert_template = re.compile(
+        r"^\s*(insert\s+into\s+.+?values\s*)\((.*)\)\s*$",
+        re.IGNORECASE | re.DOTALL,
+    )
+
+    def coalesce_inserts(self, query: str) -> bool:
+        """
+        Detects scripts consisting purely of insert statements that share the
+        same template and routes them through one executemany call, so the
+        statement is parsed once instead of once per row.
+        Returns True when the script was handled this way and False when it
+        should be executed as a regular script instead.
+        """
+        # Single statements (the common case) skip the splitting and
+        # matching work entirely.
+        if ";" not in query.rstrip(";"):
+            return False
+
+        statements = [
+            statement.strip() for statement in query.split(";") if statement.strip()
+        ]
+        if len(statements) < 2:
+            return False
+
+        matches = [self._insert_template.match(statement) for statement in statements]
+        if not all(matches) or len({match.group(1) for match in matches}) != 1:
+            return False
+
+        try:
+            # The values are SQL literals, which for numbers and quoted
+            # strings parse as Python literals as well.
+            rows = [ast.literal_eval(f"({match.group(2)},)") for match in matches]
+        except (ValueError, SyntaxError):
+            return False
+        if len({len(row) for row in rows}) != 1:
+            return False
+
+        placeholders = self._placeholder_cache.setdefault(
+            len(rows[0]), ", ".join(["%s"] * len(rows[0]))
+        )
+        self.cursor.executemany(f"{matches[0].group(1)}({placeholders})", rows)
+        return True
+
     def run_many_queries(
         self, query: str, data: list[list[str]], auto_commit: bool = True
     ) -> None:
         try:
-            self.cursor.executemany(query, data)
+            for table in self._table_ref.findall(query.lower()):
+                self._invalidate(table)
+            prep_cursor = self.prepared_cursor(query)
+            for chunk in self.packet_chunks(data):
+                prep_cursor.executemany(query, chunk)
             if not auto_commit:
                 return
             self.commit()
         except Exception as error:
             print(f"Error executing queries '{query}':\n\t", error)
 
+    def fetch_batched(self, size: int = 1000) -> list:
+        """
+        Fetches all remaining rows from the cursor in fixed-size batches.
+        Returns the same list fetchall would, but avoids one giant allocation
+        spike when a result set is large.
+        """
+        rows: list = []
+        while batch := self.cursor.fetchmany(size):
+            rows.extend(batch)
+        return rows
+
+    def max_packet(self) -> int:
+        """
+        Returns the server's max_allowed_packet in bytes.
+        The value is fetched once and cached for the lifetime of the connection.
+        """
+        if self._max_packet is None:
+            try:
+                self.cursor.execute("show variables like 'max_allowed_packet'")
+                self._max_packet = int(self.cursor.fetchall()[0][1])
+            except Exception as e:
+                print(f"Error getting max_allowed_packet:", e)
+                self._max_packet = 64 * 1024 * 1024
+        return self._max_packet
+
+    def packet_chunks(self, data: list):
+        """
+        Yields slices of data sized to stay safely under max_allowed_packet,
+        so arbitrarily large inserts neither exceed the packet limit nor
+        materialize one huge statement in memory.
+        Row size is estimated from the first row.
+        Also bounded by the prepared-statement placeholder limit: the
+        protocol carries the placeholder count as an unsigned 16-bit int, so
+        one statement can bind at most 65,535 values no matter how small the
+        rows are.
+        """
+        if not data:
+            return
+        chunk = max(1, int(self.max_packet() * 0.5 / len(repr(data[0]))))
+        chunk = min(chunk, max(1, 65_535 // len(data[0])))
+        for i in range(0, len(data), chunk):
+            yield data[i : i + chunk]
+
     def insert_data(
         self,
         table: str,
@@ -229,7 +527,7 @@ class ConnectSQL:
         Inserts data into table.
         Accepts data as path to csv file or list of list of values i.e. [[value11, value12], [value21, value22]].
         Accepts table columns as a way to control order of columns. Defaults to the order of columns that the table provides if unprovided.
-        Accepts data columns which is used for printing source and destination columns (debugging tool).
+        Accepts data columns which is used for logging source and destination columns at debug level (debugging tool).
         If a csv path is provided the input is ignored and column names from the csv file is used.
 
         >>> database = ConnectSQL("localhost")
@@ -243,7 +541,6 @@ class ConnectSQL:
         [('John', 'Smith'), ('Karen', 'Johnson')]
         >>> database.create_table("new_table", ["id tinyint", "name varchar(255)", "price float(15, 5)"], overwrite = True)
         >>> database.insert_data("new_table", path.join("data", "products.csv"), auto_commit = False)
-        Mapping columns with following conventions: id -> id, name -> name, price -> price
         >>> database.cursor.execute("select * from new_table where id = 2")
         >>> database.cursor.fetchall()
         [(2, 'Tablet', 490.03461)]
@@ -255,29 +552,199 @@ class ConnectSQL:
         >>> database.drop_database("new_database")
         >>> database.close_all()
         """
+        self._invalidate(table)
 
         if table_columns is None:
             table_columns = self.columns(table)
 
-        if type(data) is str:
-            data, data_columns = self.read_csv(data)
+        if (
+            isinstance(data, str)
+            and path.isfile(data)
+            and self.load_csv_infile(table, data, table_columns)
+        ):
+            if auto_commit:
+                self.commit()
+            return
 
-        if data_columns is not None:
-            print(
-                f"Mapping columns with following conventions: {", ".join([f"{data_column} -> {table_column}" for data_column, table_column in zip(data_columns, table_columns)])}"
+        if isinstance(data, str) and pacsv is not None:
+            arrow_table = pacsv.read_csv(data)
+            data_columns = arrow_table.column_names
+            # Convert to row tuples one bounded batch at a time so large csv
+            # files never sit fully in memory as Python objects.
+            batches = (
+                list(zip(*[column.to_pylist() for column in batch.columns]))
+                for batch in arrow_table.to_batches(max_chunksize=10_000)
+            )
+        elif isinstance(data, str):
+            chunks = self.read_csv_chunks(data)
+            data_columns = next(chunks, None)
+            batches = chunks
+        else:
+            batches = iter([data])
+
+        if data_columns is not None and logger.isEnabledFor(logging.DEBUG):
+            # The level check means no string work happens unless debug
+            # logging is actually on.
+            logger.debug(
+                "Mapping columns with following conventions: %s",
+                ", ".join(
+                    f"{data_column} -> {table_column}"
+                    for data_column, table_column in zip(data_columns, table_columns)
+                ),
             )
 
+        # When every table column appears in the csv header, rows are
+        # reordered by name so a csv with shuffled columns still lands in the
+        # right place. Headers with different names (like the bundled csv
+        # files) keep the original positional mapping.
+        reorder: list[int] | None = None
+        if data_columns is not None and list(data_columns) != list(table_columns):
+            column_index = {column: i for i, column in enumerate(data_columns)}
+            missing = [column for column in table_columns if column not in column_index]
+            if not missing:
+                reorder = [column_index[column] for column in table_columns]
+            elif len(missing) < len(table_columns):
+                print(
+                    f"Columns {", ".join(missing)} not found in csv header, "
+                    "falling back to positional column mapping."
+                )
+
         try:
-            self.cursor.executemany(
-                f"insert into {table} ({", ".join(table_columns)}) values ({", ".join(["%s" for _ in table_columns])})",
-                data,
-            )
+            for batch in batches:
+                if reorder is not None:
+                    batch = [[row[i] for i in reorder] for row in batch]
+                for chunk in self.packet_chunks(batch):
+                    self.multi_row_insert(
+                        table, table_columns, self._coerce_rows(table, table_columns, chunk)
+                    )
         except Exception as e:
             print(f"Error inserting data:", e)
 
         if auto_commit:
             self.commit()
 
+    def _column_converters(self, table_info: list[str]) -> dict:
+        """
+        Derives a column name to converter mapping from table info, for the
+        data types the server would otherwise parse from text (integers,
+        floats, timestamps). Columns with other types are left out and their
+        values pass through untouched.
+        """
+        converters: dict = {}
+        for column_info in table_info:
+            name, column_type = column_info.split()[:2]
+            converter = self._type_converters.get(column_type.split("(")[0].lower())
+            if converter is not None:
+                converters[name] = converter
+        return converters
+
+    def _coerce_rows(self, table: str, table_columns: list[str], rows: list) -> list:
+        """
+        Converts string cells to the column's Python type where the table's
+        schema is known, so the prepared statements below send typed binary
+        parameters instead of text the server has to re-parse.
+        Rows are returned unchanged when no converters apply or a value does
+        not parse; the server then validates as before.
+        """
+        column_converters = self._converters.get(table)
+        if not column_converters:
+            return rows
+        converters = [column_converters.get(column) for column in table_columns]
+        if not any(converters):
+            return rows
+        try:
+            return [
+                [
+                    converter(value)
+                    if converter is not None and isinstance(value, str)
+                    else value
+                    for converter, value in zip(converters, row)
+                ]
+                for row in rows
+            ]
+        except (ValueError, TypeError):
+            return rows
+
+    def multi_row_insert(
+        self, table: str, table_columns: list[str], rows: list
+    ) -> None:
+        """
+        Inserts rows with a single multi-row insert statement, so one packed
+        statement crosses the wire instead of one statement per row.
+        The statement is cached and prepared once per (table, columns, row
+        count) and reused with the rows flattened into one parameter sequence.
+        """
+        cache_key = (table, tuple(table_columns), len(rows))
+        if cache_key not in self._insert_sql:
+            placeholders = self._placeholder_cache.setdefault(
+                len(table_columns), ", ".join(["%s"] * len(table_columns))
+            )
+            self._insert_sql[cache_key] = (
+                f"insert into {table} ({", ".join(table_columns)}) values "
+                + ", ".join([f"({placeholders})"] * len(rows))
+            )
+        query = self._insert_sql[cache_key]
+        self.prepared_cursor(query).execute(query, list(chain.from_iterable(rows)))
+
+    def prepared_cursor(self, query: str) -> sql_cursor.MySQLCursor:
+        """
+        Returns a cursor using the binary prepared-statement protocol for
+        query, created and cached on first use. The binary protocol prepares
+        the statement once server-side and converts parameter values in C,
+        instead of escaping and quoting every cell in Python per call.
+        """
+        if query not in self._prep_cache:
+            self._prep_cache[query] = self.connection.cursor(prepared=True)
+        return self._prep_cache[query]
+
+    def load_csv_infile(
+        self, table: str, csv_path: str, table_columns: list[str]
+    ) -> bool:
+        """
+        Bulk loads a csv file with load data local infile, which streams the
+        file straight into the server and skips per-row parsing and parameter
+        marshaling entirely.
+        When the csv header names exactly the table columns, the header order
+        is used as the statement's column list, so a shuffled csv still lands
+        by name like in the fallback insert path; other headers map
+        positionally.
+        Returns True on success and False if the server refuses local infile,
+        in which case the caller should fall back to inserting row by row.
+        """
+        try:
+            with open(csv_path, "r") as csv_file:
+                header = next(csv.reader(csv_file), None)
+            if header and set(header) == set(table_columns):
+                table_columns = header
+            query: str = (
+                f"load data local infile %s into table {table} "
+                "fields terminated by ',' enclosed by '\"' "
+                "lines terminated by '\n' ignore 1 lines "
+                f"({", ".join(table_columns)})"
+            )
+            self.cursor.execute(query, (csv_path,))
+            return True
+        except Exception as e:
+            print(f"Error bulk loading csv, falling back to insert:", e)
+            return False
+
+    def read_csv_chunks(self, csv_path: str, chunk_size: int = 10_000):
+        """
+        Reads a csv file lazily and yields its rows in chunks.
+        The first yielded value is the list of column names; every value
+        after that is a chunk of up to chunk_size rows. Peak memory is
+        bounded by the chunk size no matter how large the file is, and
+        inserting can start before the last line is parsed.
+        """
+        try:
+            with open(csv_path, "r") as csv_file:
+                csv_reader = csv.reader(csv_file)
+                yield next(csv_reader)
+                while chunk := list(islice(csv_reader, chunk_size)):
+                    yield chunk
+        except Exception as e:
+            print(f"Error reading csv file:", e)
+
     def read_csv(self, csv_path: str) -> tuple[list[list[str]], list[str]]:
         """
         Reads csv file from path and returns (data, column names)
@@ -298,18 +765,70 @@ class ConnectSQL:
             print(f"Error reading csv file:", e)
 
     def create_tables(
-        self, table_dict: dict[str, list[str]], data_paths: dict[str, list[str]] = None
+        self,
+        table_dict: dict[str, list[str]],
+        data_paths: dict[str, list[str]] = None,
+        parallel: bool = False,
     ) -> None:
-        for table, table_info in table_dict.items():
-            self.create_table(table, table_info)
+        # All DDL is sent as one multi-statement script, a single round-trip
+        # instead of one per table.
+        ddl: str = ";\n".join(
+            f"create table if not exists {self._q(table)} ({", ".join(table_info)})"
+            for table, table_info in table_dict.items()
+        )
+        try:
+            self.cursor.execute(ddl)
+            self.cursor.fetchsets()
+            if self._table_cache is not None:
+                self._table_cache.update(table_dict)
+            if self._columns_cache is not None:
+                for table, table_info in table_dict.items():
+                    self._columns_cache[table] = [
+                        column_info.split()[0] for column_info in table_info
+                    ]
+            for table, table_info in table_dict.items():
+                self._converters[table] = self._column_converters(table_info)
+        except Exception as e:
+            print(f"Error creating tables:", e)
 
         if data_paths is None:
             return
 
-        for table in table_dict:
-            if table not in table_dict:
-                continue
-            self.insert_data(table, path.join(*data_paths[table]))
+        tables_to_load = [table for table in table_dict if table in data_paths]
+
+        # Loads target disjoint tables, so with parallel = True each one gets
+        # its own pooled connection and the network waits overlap. Cursors
+        # are not thread safe, hence one worker ConnectSQL per table.
+        if parallel and self.env_key is not None and len(tables_to_load) > 1:
+            with ThreadPoolExecutor(max_workers=len(tables_to_load)) as executor:
+                futures = [
+                    executor.submit(
+                        self._insert_worker, table, path.join(*data_paths[table])
+                    )
+                    for table in tables_to_load
+                ]
+                for future in futures:
+                    future.result()
+            return
+
+        # All serial loads share one transaction with constraint checks
+        # deferred, so the redo-log flush and B-tree maintenance are paid
+        # once at the end instead of per table.
+        try:
+            with self.bulk_load():
+                for table in tables_to_load:
+                    self.insert_data(
+                        table, path.join(*data_paths[table]), auto_commit=False
+                    )
+        except Exception as e:
+            print(f"Error loading data:", e)
+
+    def _insert_worker(self, table: str, csv_path: str) -> None:
+        worker = ConnectSQL(self.env_key, self.database)
+        try:
+            worker.insert_data(table, csv_path)
+        finally:
+            worker.close_all()
 
     def columns(self, table: str) -> list[str]:
         """
@@ -323,13 +842,23 @@ class ConnectSQL:
         >>> database.drop_database("new_database")
         >>> database.close_all()
         """
-        try:
-            self.cursor.execute(f"show columns from {table}")
-        except Exception as e:
-            print(f"Error getting columns:", e)
-
-        columns = self.cursor.fetchall()
-        return [column[0] for column in columns]
+        if self._columns_cache is None:
+            # One query fills the cache for every table in the current
+            # database, instead of a SHOW COLUMNS round-trip per table.
+            try:
+                self.cursor.execute(
+                    "select table_name, column_name from information_schema.columns "
+                    "where table_schema = database() order by table_name, ordinal_position"
+                )
+                columns_cache = {}
+                for table_name, column_name in self.fetch_batched():
+                    columns_cache.setdefault(table_name, []).append(column_name)
+                self._columns_cache = columns_cache
+            except Exception as e:
+                print(f"Error getting columns:", e)
+                return []
+
+        return self._columns_cache.get(table, [])
 
     def tables(self) -> list[str]:
         """
@@ -344,20 +873,68 @@ class ConnectSQL:
         >>> database.drop_database("new_database")
         >>> database.close_all()
         """
+        if self._table_cache is not None:
+            return sorted(self._table_cache)
+
         try:
             self.cursor.execute("show tables")
         except Exception as e:
             print(f"Error getting tables:", e)
 
-        tables = self.cursor.fetchall()
-        return [table[0] for table in tables]
+        tables = self.fetch_batched()
+        self._table_cache = {table[0] for table in tables}
+        return sorted(self._table_cache)
+
+    def _table_exists(self, table: str) -> bool:
+        """
+        Returns whether table exists in the current database.
+        Answers from the table cache when it is filled; otherwise asks the
+        server about just this table with a limit 1 lookup instead of
+        transferring the full table list.
+        """
+        if self._table_cache is not None:
+            return table in self._table_cache
+        try:
+            self.cursor.execute(
+                "select 1 from information_schema.tables "
+                "where table_schema = database() and table_name = %s limit 1",
+                (table,),
+            )
+            return self.cursor.fetchone() is not None
+        except Exception as e:
+            print(f"Error checking table:", e)
+            return False
 
-    def select(self, table: str, columns: list[str] | str | None = None) -> None:
+    def select(
+        self,
+        table: str,
+        columns: list[str] | str | None = None,
+        raw: bool = False,
+        stream: bool = False,
+        cached: bool = False,
+        where: list[tuple[str]] | None = None,
+        limit: int | None = None,
+    ) -> list | Iterator | None:
         """
         Takes a table and columns and returns given columns from desired table as list.
         To select all columns let the argument columns be None or "*" (default behavior).
         To select multiple columns provide a list of column names.
         A single column can be provided as a string.
+        With raw = True a generator of undecoded rows (bytes per cell) is
+        returned instead, streamed from a dedicated raw cursor. Useful when
+        rows are only passed through (e.g. written to csv), since no Python
+        objects are built per cell. The generator must be fully consumed.
+        With stream = True a generator of decoded rows from an unbuffered
+        cursor is returned (see iter_select), so large results never sit in
+        client memory all at once.
+        With cached = True the rows are returned directly (no fetchall
+        needed) and repeats of the same select are served from a small
+        client-side cache, invalidated when one of its tables is written
+        (see cached_select).
+        where takes conditions shaped like in update/delete, i.e.
+        [(column, logic, value), ...], bound as parameters.
+        limit caps the number of rows server-side, so unused rows are never
+        transferred (or fetched) at all.
 
         >>> database = ConnectSQL("localhost")
         >>> database.create_database("new_database")
@@ -376,15 +953,124 @@ class ConnectSQL:
         >>> database.close_all()
         """
 
+        query, params = self._build_select(table, columns, where, limit)
+
+        if raw:
+            return self.select_raw(query, params)
+        if stream:
+            return self.iter_select(table, columns, where, limit)
+        if cached:
+            return self.cached_select(query, params)
+
+        try:
+            self.cursor.execute(query, params)
+        except Exception as e:
+            print(f"Error selecting:", e)
+
+    def _build_select(
+        self,
+        table: str,
+        columns: list[str] | str | None,
+        where: list[tuple[str]] | None = None,
+        limit: int | None = None,
+    ) -> tuple[str, list | None]:
+        """
+        Assembles the select text and its bound parameters shared by all
+        select paths.
+        """
         if columns is None:
             columns = "*"
-        elif type(columns) is list:
+        elif isinstance(columns, list):
             columns = ", ".join(columns)
 
+        query: str = f"select {columns} from {table}"
+        params: list = []
+        if where is not None:
+            query += " where " + " and ".join(
+                f"{column} {logic} %s" for column, logic, _ in where
+            )
+            params += [value for _, _, value in where]
+        if limit is not None:
+            query += " limit %s"
+            params.append(limit)
+        return query, params or None
+
+    def cached_select(self, query: str, params: tuple | list | None = None) -> list:
+        """
+        Executes a read-only query and returns its rows, serving repeats of
+        the same query string from a small client-side cache instead of a
+        server round-trip. Entries remember which tables the query reads and
+        are purged when update, delete, insert_data or run_many_queries
+        touches one of them; the cache is bounded to the most recent
+        _select_cache_size distinct queries.
+        """
+        key = (query, tuple(params) if params else None)
+        if key in self._select_cache:
+            self._select_cache.move_to_end(key)
+            return self._select_cache[key][1]
+        try:
+            self.cursor.execute(query, params)
+            rows = self.cursor.fetchall()
+        except Exception as e:
+            print(f"Error selecting:", e)
+            return []
+        tables = frozenset(self._table_ref.findall(query.lower()))
+        self._select_cache[key] = (tables, rows)
+        while len(self._select_cache) > self._select_cache_size:
+            self._select_cache.popitem(last=False)
+        return rows
+
+    def _invalidate(self, table: str) -> None:
+        """
+        Drops cached select results that read the given table.
+        """
+        if not self._select_cache:
+            return
+        table = table.lower()
+        for key in [
+            key for key, (tables, _) in self._select_cache.items() if table in tables
+        ]:
+            del self._select_cache[key]
+
+    def iter_select(
+        self,
+        table: str,
+        columns: list[str] | str | None = None,
+        where: list[tuple[str]] | None = None,
+        limit: int | None = None,
+    ) -> Iterator:
+        """
+        Like select but yields decoded rows one at a time from an unbuffered
+        cursor, so rows stream as they arrive instead of being materialized
+        in one fetchall. Useful for results too large to hold in memory.
+        The generator must be fully consumed or closed before running other
+        queries on the connection.
+        """
+        query, params = self._build_select(table, columns, where, limit)
+        stream_cursor = self.connection.cursor(buffered=False)
+        try:
+            stream_cursor.execute(query, params)
+            yield from stream_cursor
+        except Exception as e:
+            print(f"Error selecting:", e)
+        finally:
+            stream_cursor.close()
+
+    def select_raw(
+        self, query: str, params: tuple | list | None = None
+    ) -> Iterator:
+        """
+        Executes query on a dedicated raw cursor and yields rows as tuples of
+        undecoded bytes, one at a time.
+        """
+        raw_cursor = self.connection.cursor(raw=True)
         try:
-            self.cursor.execute(f"select {columns} from {table}")
+            raw_cursor.execute(query, params)
+            yield from raw_cursor
         except Exception as e:
             print(f"Error selecting:", e)
+        finally:
+            raw_cursor.close()
 
     def update(
         self,
@@ -393,34 +1079,123 @@ class ConnectSQL:
         conditions: list[tuple[str]],
         auto_commit: bool = True,
     ) -> None:
-        if table not in self.tables():
+        if not self._table_exists(table):
             print(f"Table {table} does not exist.")
             return
 
-        condition_str: str = ", ".join(
-            [f"{column} {logic} {repr(value)}" for column, logic, value in conditions]
-        )
-        update_str: str = ", ".join(
-            [f"{column} = {repr(value)}" for column, value in update_list]
+        if self._batch_buffer is not None:
+            self._batch_buffer.append(("update", table, update_list, conditions))
+            return
+
+        self._invalidate(table)
+        condition_str: str = " and ".join(
+            f"{column} {logic} %s" for column, logic, _ in conditions
         )
+        update_str: str = ", ".join(f"{column} = %s" for column, _ in update_list)
 
         query: str = f"update {table} set {update_str} where {condition_str}"
+        params: list = [value for _, value in update_list] + [
+            value for _, _, value in conditions
+        ]
 
-        self.run_query(query, auto_commit)
+        self.run_query(query, params, auto_commit)
 
     def delete(
         self, table: str, conditions: list[tuple[str]], auto_commit: bool = True
     ) -> None:
-        if table not in self.tables():
+        if not self._table_exists(table):
             print(f"Table {table} does not exist.")
             return
 
-        condition_str: str = ", ".join(
-            [f"{column} {logic} {repr(value)}" for column, logic, value in conditions]
+        if self._batch_buffer is not None:
+            self._batch_buffer.append(("delete", table, conditions))
+            return
+
+        self._invalidate(table)
+        condition_str: str = " and ".join(
+            f"{column} {logic} %s" for column, logic, _ in conditions
         )
 
         query: str = f"delete from {table} where {condition_str}"
-        self.run_query(query, auto_commit)
+        params: list = [value for _, _, value in conditions]
+        self.run_query(query, params, auto_commit)
+
+    @contextmanager
+    def batch(self):
+        """
+        Buffers update and delete calls made inside the with-block and merges
+        them into as few statements as possible on exit.
+        Deletes with a single equality condition on the same table and column
+        collapse into one 'delete ... where column in (...)'; updates setting
+        the same columns keyed by a single equality condition merge into one
+        case-when update. Anything else runs individually at the end.
+        Note that merging groups operations by table, so statements are not
+        guaranteed to run in call order.
+
+        >>> database = ConnectSQL("localhost", "tech_store") # doctest: +SKIP
+        >>> with database.batch(): # doctest: +SKIP
+        ...     database.delete("products", [("product_id", "=", 1)])
+        ...     database.delete("products", [("product_id", "=", 2)])
+        """
+        self._batch_buffer = []
+        try:
+            yield self
+        finally:
+            operations, self._batch_buffer = self._batch_buffer, None
+            self._flush_batch(operations)
+
+    def _flush_batch(self, operations: list) -> None:
+        mergeable_deletes: dict[tuple[str, str], list] = {}
+        mergeable_updates: dict[tuple, list] = {}
+        leftovers: list = []
+
+        for operation in operations:
+            kind, table, conditions = operation[0], operation[1], operation[-1]
+            if len(conditions) != 1 or conditions[0][1] != "=":
+                leftovers.append(operation)
+                continue
+            key_column, _, key_value = conditions[0]
+            if kind == "delete":
+                mergeable_deletes.setdefault((table, key_column), []).append(key_value)
+                continue
+            update_list = operation[2]
+            update_key = (table, tuple(column for column, _ in update_list), key_column)
+            mergeable_updates.setdefault(update_key, []).append(
+                ([value for _, value in update_list], key_value)
+            )
+
+        for (table, key_column), key_values in mergeable_deletes.items():
+            self._invalidate(table)
+            placeholders = ", ".join(["%s"] * len(key_values))
+            self.run_query(
+                f"delete from {table} where {key_column} in ({placeholders})",
+                key_values,
+            )
+
+        for (table, update_columns, key_column), rows in mergeable_updates.items():
+            self._invalidate(table)
+            whens = " ".join(["when %s then %s"] * len(rows))
+            update_str = ", ".join(
+                f"{column} = case {key_column} {whens} else {column} end"
+                for column in update_columns
+            )
+            params: list = []
+            for column_index in range(len(update_columns)):
+                for values, key_value in rows:
+                    params += [key_value, values[column_index]]
+            params += [key_value for _, key_value in rows]
+            placeholders = ", ".join(["%s"] * len(rows))
+            self.run_query(
+                f"update {table} set {update_str} "
+                f"where {key_column} in ({placeholders})",
+                params,
+            )
+
+        for operation in leftovers:
+            if operation[0] == "update":
+                self.update(operation[1], operation[2], operation[3])
+            else:
+                self.delete(operation[1], operation[2])
 
     def add_key(
         self,
@@ -434,40 +1209,59 @@ class ConnectSQL:
         If a foreign table is added a foreign key will be added to the table referencing the primary key.
         If foreign column is not provided it is assumed that the primary and foreign column have the same name, and the primary column is reused.
         """
-        if primary_table not in self.tables():
-            print(f"Table {primary_table} does not exist.")
-            return
-        primary_query: str = (
-            f"alter table {primary_table} add primary key ({primary_column})"
-        )
-        self.run_query(primary_query)
-
-        if foreign_table is None:
-            return
+        self.add_keys([(primary_table, primary_column, foreign_table, foreign_column)])
 
-        if foreign_table not in self.tables():
-            print(f"Table {foreign_table} does not exist.")
-            return
+    def add_keys(self, specs: list[tuple]) -> None:
+        """
+        Takes a list of add_key argument tuples, i.e. (primary_table,
+        primary_column) optionally followed by foreign_table and
+        foreign_column, and applies all of them at once.
+        The key clauses are grouped so each table gets a single alter table
+        statement, meaning one table rebuild no matter how many keys it
+        receives instead of one rebuild per key.
+        """
+        clauses: dict[str, list[str]] = {}
+        for spec in specs:
+            primary_table, primary_column, foreign_table, foreign_column = (
+                *spec,
+                None,
+                None,
+            )[:4]
+            if not self._table_exists(primary_table):
+                print(f"Table {primary_table} does not exist.")
+                continue
+            clauses.setdefault(primary_table, []).append(
+                f"add primary key ({self._q(primary_column)})"
+            )
 
-        if foreign_column is None:
-            foreign_column = primary_column
+            if foreign_table is None:
+                continue
+            if not self._table_exists(foreign_table):
+                print(f"Table {foreign_table} does not exist.")
+                continue
+            if foreign_column is None:
+                foreign_column = primary_column
+            clauses.setdefault(foreign_table, []).append(
+                f"add foreign key ({self._q(foreign_column)}) "
+                f"references {self._q(primary_table)}({self._q(primary_column)})"
+            )
 
-        foreign_query: str = (
-            f"alter table {foreign_table} "
-            f"add foreign key ({foreign_column}) "
-            f"references {primary_table}({primary_column})"
-        )
-        self.run_query(foreign_query)
+        for table, table_clauses in clauses.items():
+            self.run_query(f"alter table {self._q(table)} {", ".join(table_clauses)}")
 
     def join(self, tables: list[str], join_type: str, columns: list[str]) -> str:
         for table in tables:
-            if table not in self.tables():
+            if not self._table_exists(table):
                 print(f"Table {table} does not exist.")
                 return
 
-        query: str = f"{tables[0]} "
+        query: str = f"{self._q(tables[0])} "
         for i, table in enumerate(tables[1:]):
-            query += f"{join_type} join {table} on {tables[0]}.{columns[i]} = {table}.{columns[i]} "
+            query += (
+                f"{join_type} join {self._q(table)} "
+                f"on {self._q(tables[0])}.{self._q(columns[i])}"
+                f" = {self._q(table)}.{self._q(columns[i])} "
+            )
 
         return query
 
@@ -487,7 +1281,11 @@ class ConnectSQL:
         False
         """
         try:
-            self.cursor.execute(f"drop table if exists {database}")
+            self.cursor.execute(f"drop table if exists {self._q(database)}")
+            if self._table_cache is not None:
+                self._table_cache.discard(database)
+            if self._columns_cache is not None:
+                self._columns_cache.pop(database, None)
         except Exception as e:
             print(f"Error dropping table:", e)
 
@@ -505,7 +1303,9 @@ class ConnectSQL:
         >>> ("new_database",) in database.cursor.fetchall()
         False
         """
+        self._table_cache = None
+        self._columns_cache = None
         try:
-            self.cursor.execute(f"drop database if exists {database}")
+            self.cursor.execute(f"drop database if exists {self._q(database)}")
         except Exception as e:
             print(f"Error dropping database:", e)
@@ -0,0 +1,135 @@
+from environs import env
+
+import aiomysql
+
+
+class AsyncConnectSQL:
+    """
+    Asynchronous variant of ConnectSQL backed by aiomysql.
+    Every query borrows a connection from a shared pool, so multiple
+    coroutines overlap their network waits on a single thread instead of
+    blocking each other like the synchronous class does.
+    Connection info is read from the .env file like in ConnectSQL:
+        env_key = "user=_____,password=_____,host=_____,port=_____"
+
+    Usage:
+        database = AsyncConnectSQL("localhost", "tech_store")
+        await database.connect()
+        rows = await database.select("products")
+        await database.close_all()
+    """
+
+    pool: aiomysql.Pool | None
+    env_key: str
+    database: str | None
+
+    def __init__(self, env_key: str, database: str | None = None) -> None:
+        self.pool = None
+        self.env_key = env_key
+        self.database = database
+
+    async def connect(self) -> None:
+        """
+        Creates the connection pool from the env_key.
+        """
+        connection_args = env.dict(self.env_key)
+        try:
+            self.pool = await aiomysql.create_pool(
+                user=connection_args["user"],
+                password=connection_args["password"],
+                host=connection_args["host"],
+                port=int(connection_args["port"]),
+                db=self.database,
+            )
+        except Exception as e:
+            print(f"Error creating connection pool:", e)
+
+    async def close_all(self) -> None:
+        """
+        Closes the pool and waits for all connections to be released.
+        """
+        if self.pool is None:
+            return
+        self.pool.close()
+        await self.pool.wait_closed()
+
+    async def run_query(
+        self, query: str, params: tuple | list | None = None, auto_commit: bool = True
+    ) -> None:
+        try:
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(query, params)
+                if auto_commit:
+                    await connection.commit()
+        except Exception as error:
+            print(f"Error executing query '{query}':\n\t", error)
+
+    async def insert_data(
+        self,
+        table: str,
+        data: list[list[str]],
+        table_columns: list[str] | None = None,
+        auto_commit: bool = True,
+    ) -> None:
+        """
+        Inserts rows into table.
+        Unlike the synchronous insert_data this only accepts in-memory rows;
+        bulk csv loads should go through ConnectSQL.
+        """
+        try:
+            if table_columns is None:
+                table_columns = await self.columns(table)
+            query = f"insert into {table} ({", ".join(table_columns)}) values ({", ".join(["%s"] * len(table_columns))})"
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.executemany(query, data)
+                if auto_commit:
+                    await connection.commit()
+        except Exception as e:
+            print(f"Error inserting data:", e)
+
+    async def select(self, table: str, columns: list[str] | str | None = None) -> list:
+        """
+        Returns the given columns from the desired table as a list of rows.
+        Accepts columns like the synchronous select: None or "*" for all
+        columns, a list of names, or a single name as a string.
+        """
+        if columns is None:
+            columns = "*"
+        elif isinstance(columns, list):
+            columns = ", ".join(columns)
+
+        try:
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(f"select {columns} from {table}")
+                    return await cursor.fetchall()
+        except Exception as e:
+            print(f"Error selecting:", e)
+
+    async def columns(self, table: str) -> list[str]:
+        """
+        Returns column names of a desired table.
+        """
+        try:
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(f"show columns from {table}")
+                    columns = await cursor.fetchall()
+            return [column[0] for column in columns]
+        except Exception as e:
+            print(f"Error getting columns:", e)
+
+    async def tables(self) -> list[str]:
+        """
+        Shows tables in the current database.
+        """
+        try:
+            async with self.pool.acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute("show tables")
+                    tables = await cursor.fetchall()
+            return [table[0] for table in tables]
+        except Exception as e:
+            print(f"Error getting tables:", e)
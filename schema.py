@@ -0,0 +1,46 @@
+"""
+Single source of truth for the tech_store schema.
+The mappings are wrapped in MappingProxyType so no entrypoint can mutate
+the shared schema at runtime; every script that needs the table layout
+imports it from here instead of redefining the literals.
+"""
+
+from types import MappingProxyType
+
+TABLES: MappingProxyType = MappingProxyType(
+    {
+        "orders_combined": [
+            "order_id tinyint unsigned unique",
+            "date_time timestamp",
+            "customer_name varchar(255)",
+            "customer_email varchar(255)",
+            "product_name varchar(255)",
+            "product_price float(15, 5)",
+        ],
+        "customers": [
+            "customer_id tinyint unsigned unique",
+            "customer_name varchar(255)",
+            "email varchar(255)",
+        ],
+        "orders": [
+            "order_id tinyint unsigned unique",
+            "date_time timestamp",
+            "customer_id tinyint unsigned",
+            "product_id tinyint unsigned",
+        ],
+        "products": [
+            "product_id tinyint unsigned unique",
+            "product_name varchar(255)",
+            "price float(15, 5)",
+        ],
+    }
+)
+
+DATA_PATHS: MappingProxyType = MappingProxyType(
+    {
+        "orders_combined": ["data", "orders_combined.csv"],
+        "customers": ["data", "customers.csv"],
+        "orders": ["data", "orders.csv"],
+        "products": ["data", "products.csv"],
+    }
+)